@@ -1,68 +1,87 @@
-from typing import List
+from itertools import count
+from typing import Dict, List
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse
 
 from app.models.item import Item, ItemCreate, ItemUpdate
 
 router = APIRouter()
 
-# In-memory database for demo purposes
-items_db = [
-    Item(id=1, name="Item 1", description="Description for Item 1", price=10.99),
-    Item(id=2, name="Item 2", description="Description for Item 2", price=20.50),
-]
 
+class ItemStore:
+    """In-memory database for demo purposes, one per application instance"""
 
-@router.get("/", response_model=List[Item])
-async def get_items():
+    def __init__(self):
+        # Keyed by ID (dicts keep insertion order)
+        self.items: Dict[int, Item] = {
+            1: Item(id=1, name="Item 1", description="Description for Item 1", price=10.99),
+            2: Item(id=2, name="Item 2", description="Description for Item 2", price=20.50),
+        }
+        # JSON-ready copy of items served by GET, kept in step on every write
+        self.items_json: Dict[int, dict] = {
+            item_id: item.model_dump(mode="json") for item_id, item in self.items.items()
+        }
+        self.next_id = count(max(self.items, default=0) + 1)
+
+
+def get_item_store(request: Request) -> ItemStore:
+    """Get the item store of the application serving the request"""
+    return request.app.state.item_store
+
+
+@router.get("/", response_model=None, responses={200: {"model": List[Item]}})
+async def get_items(store: ItemStore = Depends(get_item_store)):
     """Get all items"""
-    return items_db
+    return ORJSONResponse(list(store.items_json.values()))
 
 
 @router.get("/{item_id}", response_model=Item)
-async def get_item(item_id: int):
+async def get_item(item_id: int, store: ItemStore = Depends(get_item_store)):
     """Get a specific item by ID"""
-    for item in items_db:
-        if item.id == item_id:
-            return item
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"Item with ID {item_id} not found"
-    )
+    item = store.items.get(item_id)
+    if item is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Item with ID {item_id} not found"
+        )
+    return item
 
 
 @router.post("/", response_model=Item, status_code=status.HTTP_201_CREATED)
-async def create_item(item: ItemCreate):
+async def create_item(item: ItemCreate, store: ItemStore = Depends(get_item_store)):
     """Create a new item"""
-    new_id = max([i.id for i in items_db], default=0) + 1
+    new_id = next(store.next_id)
     new_item = Item(id=new_id, **item.model_dump())
-    items_db.append(new_item)
+    store.items[new_id] = new_item
+    store.items_json[new_id] = new_item.model_dump(mode="json")
     return new_item
 
 
 @router.put("/{item_id}", response_model=Item)
-async def update_item(item_id: int, item_update: ItemUpdate):
+async def update_item(
+    item_id: int, item_update: ItemUpdate, store: ItemStore = Depends(get_item_store)
+):
     """Update an existing item"""
-    for i, item in enumerate(items_db):
-        if item.id == item_id:
-            update_data = item_update.model_dump(exclude_unset=True)
-            updated_item = item.model_copy(update=update_data)
-            items_db[i] = updated_item
-            return updated_item
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"Item with ID {item_id} not found"
-    )
+    item = store.items.get(item_id)
+    if item is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Item with ID {item_id} not found"
+        )
+    # ItemUpdate has already validated the patch, so apply it in place
+    for field, value in item_update.model_dump(exclude_unset=True).items():
+        setattr(item, field, value)
+    store.items_json[item_id] = item.model_dump(mode="json")
+    return item
 
 
 @router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_item(item_id: int):
+async def delete_item(item_id: int, store: ItemStore = Depends(get_item_store)):
     """Delete an item"""
-    for i, item in enumerate(items_db):
-        if item.id == item_id:
-            items_db.pop(i)
-            return
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"Item with ID {item_id} not found"
-    )
+    if store.items.pop(item_id, None) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Item with ID {item_id} not found"
+        )
+    del store.items_json[item_id]
@@ -1,28 +1,51 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.routes import router as api_router
+from app.api.v1.items import ItemStore
 from app.core.config import settings
 
-app = FastAPI(
-    title="Python Microservice",
-    description="A modern Python microservice built with FastAPI",
-    version="0.1.0",
-)
 
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    """Report validation errors with orjson so rejected inf/nan inputs still encode"""
+    return ORJSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        content={"detail": jsonable_encoder(exc.errors())},
+    )
 
-app.include_router(api_router, prefix="/api")
 
+def create_app() -> FastAPI:
+    """Build and configure a new application instance"""
+    app = FastAPI(
+        title="Python Microservice",
+        description="A modern Python microservice built with FastAPI",
+        version="0.1.0",
+        default_response_class=ORJSONResponse,
+    )
 
-@app.get("/", tags=["Health"])
-async def health_check():
-    """Health check endpoint"""
-    return {"status": "healthy"}
+    app.add_exception_handler(RequestValidationError, validation_exception_handler)
+
+    # Configure CORS
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    app.state.item_store = ItemStore()
+    app.include_router(api_router, prefix="/api")
+
+    @app.get("/", tags=["Health"])
+    async def health_check():
+        """Health check endpoint"""
+        return {"status": "healthy"}
+
+    return app
+
+
+app = create_app()
@@ -5,7 +5,7 @@ class ItemBase(BaseModel):
     """Base item model with common attributes"""
     name: str = Field(..., min_length=1, max_length=100)
     description: str = Field(..., min_length=1)
-    price: float = Field(..., gt=0)
+    price: float = Field(..., gt=0, allow_inf_nan=False)
 
 
 class ItemCreate(ItemBase):
@@ -17,7 +17,7 @@ class ItemUpdate(BaseModel):
     """Model for updating an item (all fields optional)"""
     name: str | None = Field(None, min_length=1, max_length=100)
     description: str | None = Field(None, min_length=1)
-    price: float | None = Field(None, gt=0)
+    price: float | None = Field(None, gt=0, allow_inf_nan=False)
 
 
 class Item(ItemBase):
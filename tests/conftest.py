@@ -0,0 +1,17 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+
+API_URL = "http://testserver/api/v1/"
+
+
+def _api_client():
+    """v1 API test client for a new app, with app lifespan run around it"""
+    with TestClient(create_app(), base_url=API_URL) as test_client:
+        yield test_client
+
+
+# One client for the whole session, and one per test for a fresh item store
+client = pytest.fixture(scope="session", name="client")(_api_client)
+fresh_client = pytest.fixture(name="fresh_client")(_api_client)
@@ -1,80 +1,139 @@
-from fastapi.testclient import TestClient
+import pytest
 
-from app.main import app
+NEW_ITEM = {
+    "name": "Test Item",
+    "description": "Test Description",
+    "price": 15.99
+}
 
-client = TestClient(app)
+ITEM_TO_DELETE = {
+    "name": "Item to Delete",
+    "description": "This item will be deleted",
+    "price": 9.99
+}
 
+ITEM_UPDATE = {
+    "name": "Updated Item"
+}
 
-def test_health_check():
+
+@pytest.fixture(scope="class")
+def item_response(request, client):
+    """Response to a GET of the item ID given as the indirect parameter"""
+    return client.get(f"items/{request.param}")
+
+
+@pytest.mark.parametrize(
+    "method,url,status,body",
+    [
+        ("GET", "items/999", 404, None),
+        ("PUT", "items/999", 404, {"name": "Missing"}),
+        ("DELETE", "items/999", 404, None),
+        ("POST", "items/", 422, {"name": "No price"}),
+        ("POST", "items/", 422, {**NEW_ITEM, "price": float("inf")}),
+        ("PUT", "items/1", 422, {"price": float("nan")}),
+    ],
+)
+def test_endpoint_error_status(client, method, url, status, body):
+    """Test the status code returned for missing items and invalid bodies"""
+    response = client.request(method, url, json=body)
+    assert response.status_code == status
+
+
+def test_health_check(client):
     """Test the health check endpoint"""
-    response = client.get("/")
+    response = client.get(client.base_url.join("/"))
     assert response.status_code == 200
     assert response.json() == {"status": "healthy"}
 
 
-def test_get_items():
+def test_get_items(client):
     """Test getting all items"""
-    response = client.get("/api/v1/items/")
+    response = client.get("items/")
     assert response.status_code == 200
     items = response.json()
     assert isinstance(items, list)
     assert len(items) >= 2
 
 
-def test_get_item():
-    """Test getting a specific item"""
-    response = client.get("/api/v1/items/1")
-    assert response.status_code == 200
-    item = response.json()
-    assert item["id"] == 1
-    assert "name" in item
-    assert "description" in item
-    assert "price" in item
+@pytest.mark.parametrize("item_response", [1], indirect=True)
+class TestGetItem:
+    """Tests sharing a single GET of a specific item"""
 
+    def test_status(self, item_response):
+        """Test the item request succeeds"""
+        assert item_response.status_code == 200
 
-def test_create_item():
+    def test_id(self, item_response):
+        """Test the returned item has the requested ID"""
+        assert item_response.json()["id"] == 1
+
+    def test_fields(self, item_response):
+        """Test the returned item has all item fields"""
+        item = item_response.json()
+        assert "name" in item
+        assert "description" in item
+        assert "price" in item
+
+
+def test_create_item(client):
     """Test creating a new item"""
-    new_item = {
-        "name": "Test Item",
-        "description": "Test Description",
-        "price": 15.99
-    }
-    response = client.post("/api/v1/items/", json=new_item)
+    response = client.post("items/", json=NEW_ITEM)
     assert response.status_code == 201
     created_item = response.json()
-    assert created_item["name"] == new_item["name"]
-    assert created_item["description"] == new_item["description"]
-    assert created_item["price"] == new_item["price"]
+    assert {k: created_item[k] for k in NEW_ITEM} == NEW_ITEM
     assert "id" in created_item
 
 
-def test_update_item():
+def test_update_item(client):
     """Test updating an item"""
-    update_data = {
-        "name": "Updated Item"
-    }
-    response = client.put("/api/v1/items/1", json=update_data)
+    response = client.put("items/1", json=ITEM_UPDATE)
     assert response.status_code == 200
     updated_item = response.json()
     assert updated_item["id"] == 1
-    assert updated_item["name"] == update_data["name"]
+    assert updated_item["name"] == ITEM_UPDATE["name"]
 
 
-def test_delete_item():
+def test_delete_item(client):
     """Test deleting an item"""
     # First create an item to delete
-    new_item = {
-        "name": "Item to Delete",
-        "description": "This item will be deleted",
-        "price": 9.99
-    }
-    create_response = client.post("/api/v1/items/", json=new_item)
-    created_item = create_response.json()
-    
+    created_item = client.post("items/", json=ITEM_TO_DELETE).json()
+
     # Then delete it
-    delete_response = client.delete(f"/api/v1/items/{created_item['id']}")
+    delete_response = client.delete(f"items/{created_item['id']}")
     assert delete_response.status_code == 204
-    
+
     # Verify it's gone
-    get_response = client.get(f"/api/v1/items/{created_item['id']}")
+    get_response = client.get(f"items/{created_item['id']}")
     assert get_response.status_code == 404
+
+
+def test_get_items_reflects_writes(fresh_client):
+    """Test that the item list shows every create, update and delete"""
+    initial = fresh_client.get("items/").json()
+
+    created = fresh_client.post("items/", json=NEW_ITEM).json()
+    assert fresh_client.get("items/").json() == initial + [created]
+
+    updated = fresh_client.put(f"items/{created['id']}", json=ITEM_UPDATE).json()
+    assert updated["name"] == ITEM_UPDATE["name"]
+    assert fresh_client.get("items/").json() == initial + [updated]
+
+    fresh_client.delete(f"items/{created['id']}")
+    assert fresh_client.get("items/").json() == initial
+
+
+def test_deleted_ids_are_not_reused(fresh_client):
+    """Test that new items never take the ID of a deleted item"""
+    first = fresh_client.post("items/", json=NEW_ITEM).json()
+    assert first["id"] == 3
+    fresh_client.delete(f"items/{first['id']}")
+
+    second = fresh_client.post("items/", json=NEW_ITEM).json()
+    assert second["id"] == 4
+
+
+def test_apps_do_not_share_items(client, fresh_client):
+    """Test that each app from create_app has its own item store"""
+    assert fresh_client.delete("items/2").status_code == 204
+    assert client.get("items/2").status_code == 200